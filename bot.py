@@ -0,0 +1,443 @@
+"""
+NaverCafeBot: 로그인 / 메뉴 이동 / 게시글 수집 / 댓글·좋아요 액션
+GUI(main.py)와 헤드리스 러너(runner.py)가 engine.py를 통해 공유한다. (tkinter 미사용)
+"""
+import logging
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver import ActionChains, Keys
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import LENGTH_TO_MAX_CHARS, Config
+from driver_facade import CommandCounter, TrackedDriver
+from frontier import Block, find_block
+from helpers import (article_id, build_prompt, build_prompt_for_community,
+                     extract_comment, inner_article_url, smart_clip_korean,
+                     validate_comment)
+from model_router import ModelRouter
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# 제목/본문 폴백 셀렉터 (스킨/에디터 버전별)
+TITLE_CANDIDATES = [
+    (By.CSS_SELECTOR, "h3.title_text"),
+    (By.CSS_SELECTOR, "div.ArticleTitle"),
+    (By.CSS_SELECTOR, "#articleTitle"),
+    (By.CSS_SELECTOR, "h2#title_area"),
+]
+
+CONTENT_CANDIDATES = [
+    (By.CSS_SELECTOR, "div.se-module.se-module-text"),
+    (By.CSS_SELECTOR, "div.se-component.se-text"),
+    (By.CSS_SELECTOR, "div.se_component_wrap"),
+    (By.CSS_SELECTOR, "div.ContentRenderer"),
+    (By.CSS_SELECTOR, "#postContent"),
+]
+
+COMMENT_BOX = (By.CSS_SELECTOR, "textarea.comment_inbox_text")
+DIRECT_FAIL_LIMIT = 3  # 안쪽 문서 직접 로드가 연속 실패하면 이번 실행은 셸로만 연다
+FRAME_WAIT_SEC = 20     # 셸로 열 때 cafe_main 프레임 대기 (느린 CI 대비)
+
+
+class NaverCafeBot:
+    def __init__(self, cfg: Config, logger: logging.Logger):
+        self.cfg = cfg; self.logger = logger
+        self.driver: Optional[TrackedDriver] = None
+        self.counter = CommandCounter()
+        self._seen: set[str] = set(); self.current_page = 1
+        self._page_truncated = False
+        self.last_scan: List[Optional[int]] = []; self.page_stats: dict = {}
+        self._openai: Optional["OpenAI"] = None
+        self.debug_dir = "."  # 실패 스크린샷/HTML 저장 위치 (엔진이 실행 디렉터리로 지정)
+        self.logged_in = False
+        self.current_menu: Optional[str] = None; self._menu_loaded_at = 0.0
+        self.last_load_sec: Optional[float] = None  # 마지막 게시글 페이지 로드 시간 (거버너 샘플)
+        self.article_frame: Optional[str] = "cafe_main"  # 현재 게시글이 있는 프레임 (직접 로드면 None = 최상위)
+        self.load_stats = {"direct": 0, "shell": 0, "fallback": 0}; self._direct_failures = 0
+        self.router: Optional[ModelRouter] = None
+        self.last_generation: Optional[dict] = None  # 마지막 댓글 생성에 쓰인 모델/지연 (실행 리포트용)
+        self.last_article: dict = {}  # 마지막 게시글 제목/댓글/단계별 시간 (dry-run 리포트용)
+
+    def _ensure_openai(self):
+        if self._openai is None:
+            from openai import OpenAI  # 지연 import: 헤드리스 시작 시간 단축
+            self.router = ModelRouter(self.cfg, self.logger)
+            self._openai = OpenAI(api_key=self.cfg.openai_api_key, base_url=self.cfg.openai_base_url or None,
+                                  timeout=self.cfg.openai_timeout_sec)
+
+    def _client_for(self, model: str):
+        """대체 모델이 있으면 기본 모델만 SDK 재시도(429 백오프) 없이 곧바로 넘기고, 대체 모델 호출은 SDK 재시도 유지."""
+        if self.router.fallback and model == self.router.primary:
+            return self._openai.with_options(max_retries=0)
+        return self._openai
+
+    def _generate_comment(self, title: str, content: str, *, category_name: str, is_review: bool) -> str:
+        self._ensure_openai()
+        max_chars = self.cfg.max_comment_chars or LENGTH_TO_MAX_CHARS.get(self.cfg.length_label, 40)
+        prompt = (
+            build_prompt(self.cfg.tone, max_chars, title, content)
+            if is_review else
+            build_prompt_for_community(category_name, self.cfg.tone, max_chars, title, content)
+        )
+        model, resp, sec = self.router.call(lambda m: self._client_for(m).responses.create(
+            model=m,
+            input=prompt,
+            temperature=self.cfg.temperature,
+            max_output_tokens=self.cfg.max_output_tokens,  # ✅ 여기!
+        ))
+        self.last_generation = {"model": model, "sec": sec}
+        text = getattr(resp, "output_text", "").strip()
+        raw = extract_comment(text).strip()
+        comment = smart_clip_korean(raw, max_chars)
+        if not validate_comment(comment, min_len=6, max_len=max_chars):
+            comment = smart_clip_korean(raw.split("\n")[0].strip(), max_chars)  # 첫 줄만 재시도
+        if not validate_comment(comment, min_len=6, max_len=max_chars):
+            # 잘린 JSON/군더더기 원문이 그대로 게시되지 않도록 이 글은 건너뜀 (_write_comment가 0 반환)
+            raise ValueError(f"생성 댓글이 길이/형식 규칙을 충족하지 않습니다: {text[:60]!r}")
+        return comment
+
+    # === 이하 브라우저/네비/수집/액션은 동일 ===
+    def open_browser(self):
+        from webdriver_manager.chrome import ChromeDriverManager
+        opts = webdriver.ChromeOptions()
+        opts.add_argument("--disable-gpu"); opts.add_argument("--no-sandbox")
+        if self.cfg.headless:
+            opts.add_argument("--headless=new"); opts.add_argument("--disable-dev-shm-usage")
+            opts.add_argument("--window-size=1280,900")
+        opts.add_argument("--lang=ko-KR"); opts.add_experimental_option("prefs", {"intl.accept_languages": "ko-KR,ko"})
+        service = ChromeService(ChromeDriverManager().install())
+        self.driver = TrackedDriver(webdriver.Chrome(service=service, options=opts), self.counter)
+        self.logger.info("Chrome session started.")
+
+    def recycle_tab(self):
+        """새 탭을 열고 기존 탭을 닫아 렌더러 메모리를 반환 (쿠키/로그인 유지)."""
+        assert self.driver
+        old = self.driver.current_window_handle
+        self.driver.switch_to.new_window("tab")
+        new = self.driver.current_window_handle
+        self.driver.switch_to.window(old); self.driver.close()
+        self.driver.switch_to.window(new)
+        self.driver.invalidate_frame(); self.current_menu = None
+
+    def restart_browser(self):
+        """드라이버째 재시작. CDP로 전체 쿠키를 옮겨 재로그인 없이 세션 유지, 실패 시 재로그인."""
+        assert self.driver
+        try: cookies = self.driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+        except Exception as e: cookies = []; self.logger.warning(f"쿠키 백업 실패: {e}")
+        try: self.driver.quit()
+        except Exception: pass
+        self.driver = None; self.current_menu = None
+        self.open_browser()
+        try:
+            if not cookies: raise RuntimeError("no cookies")
+            self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+            self.logger.info(f"Restored {len(cookies)} cookies after restart.")
+        except Exception as e:
+            self.logger.warning(f"쿠키 복원 실패, 다시 로그인합니다: {e}")
+            self.logged_in = False; self.login()
+
+    def close_browser(self):
+        self.logged_in = False; self.current_menu = None
+        if self.driver: self.driver.quit(); self.driver=None; self.logger.info("Chrome session closed.")
+
+    def login(self):
+        assert self.driver
+        with self.counter.stage("login"):
+            self._login()
+        self.logged_in = True
+
+    def _login(self):
+        self.driver.get(self.cfg.base_url); time.sleep(1.6)
+        if not self.cfg.naver_id or not self.cfg.naver_pw: raise RuntimeError("NAVER ID/Password가 비어 있습니다.")
+        id_input = self.driver.find_element(By.ID, "id"); id_input.click()
+        self._type_text(id_input, self.cfg.naver_id); time.sleep(0.7)
+        pw_input = self.driver.find_element(By.ID, "pw"); pw_input.click()
+        self._type_text(pw_input, self.cfg.naver_pw); time.sleep(0.7)
+        self.driver.find_element(By.ID, "log.login").click(); time.sleep(2.0)
+        # 로그인 폼에 그대로 남아 있으면 실패(비밀번호 오류 / 캡차 / 보호조치) → logged_in으로 표시하지 않음
+        if "nidlogin" in (self.driver.current_url or ""):
+            self._dump_debug("login_fail")
+            raise RuntimeError("네이버 로그인 실패 (비밀번호 확인 / 캡차 / 보호조치). 브라우저에서 직접 확인하세요.")
+        self.logger.info("Logged in successfully.")
+
+    def _type_text(self, element, text: str):
+        """클립보드 붙여넣기(기본, 캡차 회피) 또는 send_keys(헤드리스/클립보드 없는 환경)."""
+        if self.cfg.use_clipboard:
+            import pyperclip
+            try: prev = pyperclip.paste()
+            except Exception: prev = None
+            pyperclip.copy(text)
+            ActionChains(self.driver).key_down(Keys.CONTROL).send_keys("v").key_up(Keys.CONTROL).perform()
+            # 사용자 클립보드 복원 (웜업 중 설정 입력과 충돌 방지)
+            if prev is not None:
+                try: pyperclip.copy(prev)
+                except Exception: pass
+        else:
+            element.send_keys(text)
+
+    def _dump_debug(self, prefix: str = "debug"):
+        # 실패 시 상황 파악용 아티팩트 (Actions에서 업로드)
+        ts = time.strftime("%Y%m%d_%H%M%S")
+        png = os.path.join(self.debug_dir, f"{prefix}_{ts}.png")
+        html = os.path.join(self.debug_dir, f"{prefix}_{ts}.html")
+        try: self.driver.save_screenshot(png)
+        except Exception: pass
+        try:
+            with open(html, "w", encoding="utf-8") as f: f.write(self.driver.page_source)
+        except Exception: pass
+        return png, html
+
+    def _find_first(self, locators, timeout: float = 10):
+        last_err = None
+        for by, sel in locators:
+            try: return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located((by, sel)))
+            except Exception as e: last_err = e; timeout = 1  # 첫 후보에서 페이지 로드를 기다렸으므로 나머지는 짧게
+        raise last_err or TimeoutException("Element not found for any locator")
+
+    def _extract_article(self):
+        """게시글 문서(cafe_main 프레임 또는 직접 로드한 최상위)에서 제목/본문 추출. 본문은 여러 조각이면 join, 없으면 빈 문자열."""
+        title = self._find_first(TITLE_CANDIDATES, timeout=10).text.strip()
+        content = ""
+        for by, sel in CONTENT_CANDIDATES:
+            nodes = self.driver.find_elements(by, sel)
+            content = " ".join(n.text for n in nodes if n.text.strip())
+            if content.strip(): break
+        if not content.strip():
+            # 레이지 로드 대비: 한 번 스크롤 후 재시도
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.3);"); time.sleep(0.8)
+            by, sel = CONTENT_CANDIDATES[0]
+            content = " ".join(n.text for n in self.driver.find_elements(by, sel) if n.text.strip())
+        if not content.strip():
+            self.logger.warning("본문 추출 실패. 스크린샷 덤프"); self._dump_debug("content_fail")
+        return title, content
+
+    def go_to_menu(self, menu_id: str, page: int = 1, *, reuse_within: float = 0.0):
+        """reuse_within(초): 같은 메뉴/페이지를 그 시간 안에 연 상태면(웜업 미리 열기) 다시 로드하지 않음."""
+        assert self.driver
+        if (reuse_within > 0 and self.current_menu == menu_id and self.current_page == page
+                and time.monotonic() - self._menu_loaded_at < reuse_within):
+            self.logger.debug(f"Reusing preloaded menu {menu_id} (page {page})"); return
+        url = self.cfg.cafe_base.format(menu_id=menu_id)
+        if page > 1: url = f"{url}?page={page}"
+        with self.counter.stage("menu"): self.driver.get(url)
+        time.sleep(1.2)
+        self.current_menu = menu_id; self._menu_loaded_at = time.monotonic()
+        self.current_page = page; self.logger.debug(f"Navigated to menu {menu_id}: {url}")
+
+    def collect_post_links(self, target_count: int, per_page_cap: int, max_pages: int, *,
+                           start_page: int = 1, initial: Optional[List[str]] = None,
+                           on_page: Optional[Callable[[int, List[str]], None]] = None,
+                           frontier: Optional[List[Block]] = None) -> List[str]:
+        """
+        start_page/initial: 저널 재개 시 이미 스캔한 페이지 다음부터, 기존 수집분을 이어서 모음.
+        on_page(page, added): 페이지 스캔 직후 호출(저널 기록용).
+        frontier: 지난 실행까지 처리한 [low, high] 글번호 블록. 블록 안 글은 건너뛰고, 페이지 전체가
+                  블록 안이면 cfg.pagination_mode에 따라 중단(stop)하거나 그 아래 첫 미처리 페이지로 점프(seek).
+        본 글번호 순서는 self.last_scan, 페이지 통계는 self.page_stats에 남는다.
+        """
+        assert self.driver
+        blocks = frontier or []
+        mode = self.cfg.pagination_mode if blocks else "off"
+        results: List[str] = list(initial or [])[:target_count]; self._seen.update(results)
+        self.last_scan = []; self.page_stats = {"scanned": 0, "skipped": 0, "probes": 0, "known": 0}
+        page_idx = start_page - 1
+        while len(results) < target_count and page_idx < max_pages:
+            page_idx += 1
+            page_links = self._scrape_links_on_current_page(per_page_cap)
+            page_links = [u.split('?')[0] for u in page_links if u]
+            self.page_stats["scanned"] += 1
+            ids = [article_id(u) for u in page_links]
+            known = [find_block(blocks, a) is not None for a in ids]
+            self.page_stats["known"] += sum(known)
+            unique_new = [u for u, k in zip(page_links, known) if not k and u not in self._seen]; self._seen.update(unique_new)
+            added: List[str] = []
+            for u in unique_new:
+                if u not in results:
+                    results.append(u); added.append(u)
+                    if len(results) >= target_count: break
+            self.last_scan.extend(ids)
+            if self._page_truncated: self.last_scan.append(None)  # 상한으로 잘린 페이지는 목록 연속성 단절
+            if on_page: on_page(self.current_page, added)
+            self.logger.debug(f"Page {self.current_page} collected {len(unique_new)} new links. Total: {len(results)}")
+            if len(results) >= target_count: break
+
+            if mode != "off":
+                if not page_links:
+                    self.logger.debug("[Pagination] empty page, end of board."); break
+                top = blocks[0][1]
+                if mode == "stop" and all(a is not None and a <= top for a in ids):
+                    self.logger.info(f"[Pagination] page {self.current_page} is older than frontier {top}, stop.")
+                    break
+                if mode == "seek" and all(known):
+                    low = find_block(blocks, ids[-1])[0]
+                    from_page = self.current_page
+                    target = self._seek_page_below(low, max_pages, per_page_cap)
+                    if target is None:
+                        self.logger.info(f"[Pagination] no unprocessed posts below #{low} within {max_pages} pages, stop.")
+                        break
+                    self.page_stats["skipped"] += max(0, target - from_page - 1)
+                    self.logger.info(f"[Pagination] frontier seek: page {from_page} -> {target} "
+                                     f"(skipped {target - from_page - 1} pages)")
+                    if self.current_page != target: self._go_to_page(target)
+                    page_idx = target - 1
+                    continue
+            if not self._go_to_next_page(): self.logger.debug("No more pages or failed to move next."); break
+        return results
+
+    def _seek_page_below(self, low: int, max_pages: int, per_page_cap: int) -> Optional[int]:
+        """
+        현재 페이지(전체가 처리된 블록 안) 뒤에서 글번호 low보다 오래된 글이 처음 나오는 페이지를
+        갤로핑(1, 2, 4, ...) 후 이진 탐색으로 찾는다. 빈 페이지(목록 끝)도 경계로 본다.
+        """
+        def has_older(page: int) -> bool:
+            self._go_to_page(page); self.page_stats["probes"] += 1
+            ids = [article_id(u.split('?')[0]) for u in self._scrape_links_on_current_page(per_page_cap) if u]
+            ids = [a for a in ids if a is not None]
+            return not ids or min(ids) < low
+
+        good = self.current_page; hit = None; step = 1
+        while good < max_pages:
+            probe = min(good + step, max_pages)
+            if has_older(probe): hit = probe; break
+            good = probe; step *= 2
+        if hit is None: return None
+        while hit - good > 1:
+            mid = (good + hit) // 2
+            if has_older(mid): hit = mid
+            else: good = mid
+        return hit
+
+    def _scrape_links_on_current_page(self, per_page_cap: int = 50) -> List[str]:
+        links: List[str] = []
+        with self.counter.stage("collect"):
+            self.driver.enter_frame("cafe_main")
+            anchors = self.driver.find_elements(By.CSS_SELECTOR, self.cfg.post_anchor_selector)
+            self._page_truncated = len(anchors) > per_page_cap
+            for a in anchors[:per_page_cap]:
+                try: href = a.get_attribute("href")
+                except Exception: href=None
+                if href: links.append(href)
+        return links
+
+    def _go_to_next_page(self) -> bool:
+        return self._go_to_page(self.current_page + 1)
+
+    def _go_to_page(self, page: int) -> bool:
+        assert self.driver
+        # current_url은 프레임과 무관하게 최상위 문서 URL을 돌려주므로 프레임 이탈 불필요
+        with self.counter.stage("paginate"): current_url = self.driver.current_url
+        parsed = urlparse(current_url); q = parse_qs(parsed.query)
+        q["page"] = [str(page)]
+        new_url = urlunparse(parsed._replace(query=urlencode(q, doseq=True)))
+        self.logger.debug(f"[Pagination] Move {self.current_page} -> {page}: {new_url}")
+        try:
+            with self.counter.stage("paginate"): self.driver.get(new_url)
+            time.sleep(1.2); self.current_page = page; self._menu_loaded_at = time.monotonic(); return True
+        except Exception as e:
+            self.logger.warning(f"[Pagination] failed to move page: {e}"); return False
+
+    def open_article(self, link: str, *, need_comment: bool = True):
+        """need_comment: 이 글에 댓글을 쓸지(재개 시 이미 쓴 글/좋아요만이면 False) → 직접 로드 시 댓글창 확인 여부."""
+        assert self.driver
+        self.current_menu = None; self.last_article = {}
+        t0 = time.perf_counter()
+        with self.counter.stage("open"):
+            if not self._open_direct(link, need_comment=need_comment):
+                self.driver.get(link); self.article_frame = "cafe_main"; self.load_stats["shell"] += 1
+                self._wait_article_frame()
+        self.last_load_sec = round(time.perf_counter() - t0, 3)
+
+    def _wait_article_frame(self):
+        """셸의 cafe_main 프레임이 준비될 때까지 기다렸다가 진입 (고정 sleep 대신)."""
+        try:
+            WebDriverWait(self.driver, FRAME_WAIT_SEC).until(EC.frame_to_be_available_and_switch_to_it("cafe_main"))
+            self.driver.mark_frame("cafe_main")
+        except TimeoutException:
+            self.driver.invalidate_frame()
+            self.logger.warning("cafe_main 프레임 진입 실패. 스크린샷 덤프"); self._dump_debug("frame_fail")
+
+    def _open_direct(self, link: str, *, need_comment: bool) -> bool:
+        """
+        셸(메뉴/위젯/광고 + cafe_main) 대신 프레임 안쪽 게시글 문서만 최상위로 로드.
+        셸로 리다이렉트되거나 제목/본문/(댓글 쓸 글이면) 댓글창이 단독으로 렌더링되지 않으면 False(호출자가 셸로 폴백).
+        """
+        if self.cfg.article_load_mode != "direct" or self._direct_failures >= DIRECT_FAIL_LIMIT: return False
+        url = inner_article_url(link, self.cfg.article_inner_url, self.cfg.cafe_base)
+        if not url: return False
+        try:
+            self.driver.get(url)
+            if self.driver.find_elements(By.ID, "cafe_main"): raise RuntimeError("redirected to cafe shell")
+            self._find_first(TITLE_CANDIDATES, timeout=6)
+            if not any(self.driver.find_elements(by, sel) for by, sel in CONTENT_CANDIDATES):
+                raise RuntimeError("article body not rendered")
+            if need_comment: WebDriverWait(self.driver, 3).until(EC.presence_of_element_located(COMMENT_BOX))
+        except Exception as e:
+            self._direct_failures += 1; self.load_stats["fallback"] += 1
+            self.logger.debug(f"[Article] direct load failed ({e.__class__.__name__}: {e}), fallback to shell: {url}")
+            if self._direct_failures >= DIRECT_FAIL_LIMIT:
+                self.logger.info(f"[Article] 직접 로드가 {DIRECT_FAIL_LIMIT}회 연속 실패해 이번 실행은 셸로 엽니다.")
+            return False
+        self._direct_failures = 0; self.article_frame = None; self.load_stats["direct"] += 1
+        return True
+
+    def _enter_article(self):
+        if self.article_frame: self.driver.enter_frame(self.article_frame)
+        else: self.driver.leave_frame()
+
+    def write_comment(self, category_name: str, is_review: bool=False) -> int:
+        assert self.driver
+        with self.counter.stage("comment"):
+            return self._write_comment(category_name, is_review)
+
+    def _write_comment(self, category_name: str, is_review: bool) -> int:
+        self.last_generation = None; art = self.last_article
+        try:
+            self._enter_article()
+            t0 = time.perf_counter()
+            title, content = self._extract_article(); t1 = time.perf_counter()
+            art.update(title=title, extract_sec=round(t1 - t0, 3))
+            comment = self._generate_comment(title, content, category_name=category_name, is_review=is_review)
+            art.update(comment=comment, generate_sec=round(time.perf_counter() - t1, 3))
+            comment_box = WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(COMMENT_BOX))
+            if self.cfg.dry_run:  # 입력/등록 직전에서 멈춤 (사이트에 쓰기 없음)
+                self.logger.info(f"[DRY-RUN] Comment not posted: {comment}"); return 1
+            comment_box.click(); self._type_text(comment_box, comment)
+            submit_btn = self.driver.find_element(By.CSS_SELECTOR, "a.button.btn_register")
+            submit_btn.click(); time.sleep(1.4)
+            self.logger.info(f"Comment posted: {comment}"); return 1
+        except TimeoutException as e:
+            self.driver.invalidate_frame(); self._dump_debug("timeout")
+            self.logger.warning(f"[write_comment] timeout: {e}"); return 0
+        except Exception as e:
+            self.driver.invalidate_frame()
+            self.logger.warning(f"[write_comment] error: {e}"); return 0
+
+    def press_like(self) -> int:
+        assert self.driver
+        with self.counter.stage("like"):
+            return self._press_like()
+
+    def _press_like(self) -> int:
+        try:
+            self._enter_article()
+            like_buttons = self.driver.find_elements(By.CSS_SELECTOR, "div.ReplyBox a.like_no.u_likeit_list_btn._button.off span.u_ico._icon")
+            if self.cfg.dry_run:
+                self.last_article["like_candidates"] = len(like_buttons)
+                self.logger.info(f"[DRY-RUN] {len(like_buttons)} like buttons found, not clicked."); return 1
+            count = 0
+            for like_button in like_buttons:
+                like_button.click(); count += 1; time.sleep(random.uniform(1, 2.0))
+            self.logger.info(f"Liked {count} items on page."); return 1
+        except Exception as e:
+            self.driver.invalidate_frame()
+            self.logger.warning(f"[press_like] error: {e}"); return 0
@@ -1,5 +1,6 @@
-from dataclasses import dataclass, field
-from typing import List
+import json
+from dataclasses import dataclass, field, fields
+from typing import Dict, List
 
 # OpenAI Responses API에서 텍스트 생성에 일반적으로 쓰이는 모델 예시
 # 참고: 모델 개요/문서 (공식)
@@ -27,6 +28,27 @@ LENGTH_TO_MAX_CHARS = {
     "길게": 44,   # 하드캡
 }
 
+# 카테고리 → 메뉴ID
+communities_dict: Dict[str, str] = {
+    "자유게시판":"114","궁금한점 질문답변":"34","힘들어요 위로해주세요":"191","매일 쓰는 결혼일기":"458",
+    "남들은 어떻게 하나요?":"437","자주묻는질문(FAQ)":"142","다이어트 질문답변":"190",
+    "결혼준비 토론방":"113","나의 시댁은/처가댁은":"192","선택장애 모여라":"115","내신랑신부자랑하기":"160",
+    "나만의 요리비법":"193","신랑신부 갈등과 해소":"194","내가 결혼하는 이유":"195","허니문지역선정이유":"161",
+    "결혼준비 자료실":"91","다이렉트블로거":"121","데이트 맛집 소개":"196","신혼 게시판":"154",
+    "임신/출산/육아":"155","미용/시술/건강관리":"453",
+}
+
+
+review_dict : Dict[str, str] = {
+    "업체후기(다이렉트)": "134","타사와 비교한 다이렉트": "351","업체후기(박람회)": "144","업체후기(웨딩홀)": "147",
+    "업체후기(웨딩통합)": "135","업체후기(스튜디오)": "41","업체후기(드레스)": "157","업체후기(메이크업)": "158",
+    "업체후기(혼수)": "136","후기(가전)": "280","후기(신혼혼수)": "328","후기(프로포즈)": "148",
+    "후기(상견례)": "149","후기(신혼집)": "150","후기(인테리어)": "151","후기(다이어트)": "189",
+    "후기(온라인박람회)": "139","후기(신혼생활)": "456","후기(임신출산육아)": "457","예식완료 후 총평가": "350",
+    "본식허니문리얼중계": "159","내 웨딩사진 자랑하기": "170","우리 결혼합니다": "123","우리 결혼했어요": "124",
+    "내 계약내용 공개": "125","담당자 칭찬과 추천 ": "126",
+}
+
 @dataclass
 class Config:
     # 자격증명
@@ -36,22 +58,51 @@ class Config:
 
     # LLM
     openai_model: str = DEFAULT_OPENAI_MODEL
+    openai_base_url: str = ""  # 비우면 공식 API, 로컬 스텁 예: "http://127.0.0.1:8765/v1"
     temperature: float = 0.7
     max_output_tokens: int = 150  # 한 줄 요약/댓글 용
+    openai_timeout_sec: float = 30.0
+    # 모델 라우팅: 기본 모델이 느리거나 오류가 잦으면 대체 모델로 전환, 회복되면 복귀 (""이면 끔, 예: "gpt-4.1-nano")
+    openai_fallback_model: str = ""
+    router_latency_slo_sec: float = 4.0  # 최근 router_window건 평균 지연 상한
+    router_max_error_rate: float = 0.3
+    router_window: int = 6
+    router_min_samples: int = 3  # 이만큼 쌓여야 지연/오류율로 판단 (개별 실패는 즉시 전환)
+    router_probe_every: int = 5  # 대체 모델 사용 중 N건마다 기본 모델로 복귀 시험
 
     # 생성 스타일
     tone: str = "따뜻한"
     length_label: str = "중간"
+    max_comment_chars: int = 0  # 0이면 length_label 기준(LENGTH_TO_MAX_CHARS), 값이 있으면 그 글자 수로 고정
 
     # 크롤링/액션
     headless: bool = False
+    use_clipboard: bool = True  # 로그인/댓글 입력을 클립보드 붙여넣기로 (False면 send_keys)
+    warmup: bool = False  # GUI: 설정 중 백그라운드로 브라우저 실행/로그인/첫 메뉴 미리 열기
+    warmup_menu_ttl: float = 120.0  # 미리 연 메뉴 페이지를 다시 로드하지 않고 쓰는 최대 시간(초)
     target_links: int = 10
     per_page_cap: int = 50
     max_pages: int = 100
+    pagination_mode: str = "seek"  # 지난 실행 프런티어 활용: "seek"(점프) / "stop"(새 글만) / "off"
     do_comment: bool = True
     do_like: bool = True
+    article_pause_min: float = 0.0  # 게시글 사이 무작위 대기(초), max가 0이면 대기 없음
+    article_pause_max: float = 0.0
+    dry_run: bool = False  # 수집/추출/생성까지만 하고 댓글 입력·등록/좋아요 클릭은 하지 않음 (리포트만)
     verbose: str = "INFO"
 
+    # 크롬 리소스 거버너 (긴 실행에서 탭 재생성 / 드라이버 재시작, 0이면 해당 조건 끔)
+    governor_max_rss_mb: int = 1500  # 크롬 프로세스 트리 RSS 상한 (psutil 필요)
+    governor_max_load_sec: float = 8.0  # 최근 governor_window개 게시글 평균 로드 시간 상한
+    governor_window: int = 5
+    governor_sample_every: int = 5  # RSS 샘플 주기(게시글 수)
+    governor_recycle_every: int = 0  # 조건과 무관한 주기적 탭 재생성(게시글 수)
+
+    # 프로파일링 (cProfile + tracemalloc, 실행 디렉터리에 저장)
+    profile: bool = False
+    profile_sample_interval: float = 0.0  # 초, 0이면 스택 샘플링 생략
+    profile_top_n: int = 30
+
     # 선택
     communities: list = field(default_factory=list)
     reviews: list = field(default_factory=list)
@@ -60,3 +111,14 @@ class Config:
     base_url: str = "https://nid.naver.com/nidlogin.login"
     cafe_base: str = "https://cafe.naver.com/f-e/cafes/25228091/menus/{menu_id}"
     post_anchor_selector: str = "tbody tr:not(.board-notice) a.article"
+    # 게시글 열기: "direct"면 cafe_main 안쪽 문서를 최상위로 바로 로드(안 되면 셸로 폴백), "shell"이면 항상 셸
+    article_load_mode: str = "direct"
+    article_inner_url: str = "https://cafe.naver.com/ca-fe/cafes/{cafe_id}/articles/{article_id}"
+
+
+def load_config(path: str, **defaults) -> Config:
+    """JSON 설정 파일(키 = Config 필드명)을 Config로. 모르는 키는 무시, 파일에 없는 키는 defaults → Config 기본값."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    known = {f.name for f in fields(Config)}
+    return Config(**{**defaults, **{k: v for k, v in data.items() if k in known}})
@@ -0,0 +1,124 @@
+"""
+WebDriver 파사드
+- 현재 프레임을 추적해 불필요한 switch_to 왕복을 생략
+- 모든 WebDriver 커맨드(= chromedriver 왕복)를 단계/게시글 단위로 집계
+"""
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+TOP = None            # 최상위 문서(default_content)
+_UNKNOWN = object()   # 전환 실패 등으로 현재 프레임을 모를 때
+
+
+class CommandCounter:
+    def __init__(self):
+        self.total = 0
+        self.by_stage: Counter = Counter()
+        self.by_command: Counter = Counter()
+        self.by_article: Dict[str, Counter] = {}
+        self._stages: List[str] = []
+        self._article: Optional[str] = None
+
+    @contextmanager
+    def stage(self, name: str):
+        self._stages.append(name)
+        try:
+            yield
+        finally:
+            self._stages.pop()
+
+    @contextmanager
+    def article(self, key: str):
+        prev, self._article = self._article, key
+        self.by_article.setdefault(key, Counter())
+        try:
+            yield
+        finally:
+            self._article = prev
+
+    def record(self, command: str):
+        stage = self._stages[-1] if self._stages else "other"
+        self.total += 1
+        self.by_stage[stage] += 1
+        self.by_command[command] += 1
+        if self._article is not None:
+            self.by_article[self._article][stage] += 1
+
+    def article_total(self, key: str) -> int:
+        return sum(self.by_article.get(key, Counter()).values())
+
+    def summary(self) -> dict:
+        n = len(self.by_article)
+        article_cmds = sum(self.article_total(k) for k in self.by_article)
+        return {
+            "total": self.total,
+            "articles": n,
+            "per_article_avg": round(article_cmds / n, 1) if n else 0.0,
+            "by_stage": dict(self.by_stage.most_common()),
+            "by_command": dict(self.by_command.most_common()),
+            "by_article": {k: dict(v) for k, v in self.by_article.items()},
+        }
+
+
+class TrackedDriver:
+    """
+    selenium WebDriver를 감싸는 얇은 파사드.
+    WebElement 호출도 결국 driver.execute를 거치므로 execute 하나만 가로채 전부 센다.
+    정의되지 않은 속성은 원본 드라이버로 위임(WebDriverWait/ActionChains 그대로 사용 가능).
+    """
+
+    def __init__(self, driver, counter: Optional[CommandCounter] = None):
+        self._driver = driver
+        self.counter = counter or CommandCounter()
+        self.frame = TOP
+        orig_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            self.counter.record(driver_command)
+            return orig_execute(driver_command, params)
+
+        driver.execute = execute
+
+    @property
+    def raw(self):
+        return self._driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    # ----- 네비게이션 (최상위 문서로 리셋) -----
+    def get(self, url: str):
+        self.frame = _UNKNOWN
+        self._driver.get(url)
+        self.frame = TOP
+
+    # ----- 프레임 -----
+    def enter_frame(self, name: str = "cafe_main") -> bool:
+        if self.frame == name:
+            return True
+        try:
+            if self.frame is not TOP:
+                self._driver.switch_to.default_content()
+            self._driver.switch_to.frame(name)
+            self.frame = name
+            return True
+        except Exception:
+            self.frame = _UNKNOWN
+            return False
+
+    def leave_frame(self):
+        if self.frame is TOP:
+            return
+        try:
+            self._driver.switch_to.default_content()
+            self.frame = TOP
+        except Exception:
+            self.frame = _UNKNOWN
+
+    def mark_frame(self, name: Optional[str]):
+        """WebDriverWait(frame_to_be_available_and_switch_to_it) 등으로 직접 전환한 뒤 추적 상태 동기화."""
+        self.frame = name
+
+    def invalidate_frame(self):
+        self.frame = _UNKNOWN
@@ -0,0 +1,240 @@
+"""
+실행 엔진: 저널 / 프로파일러 / 봇을 묶어 선택된 커뮤니티·후기 카테고리를 순서대로 처리.
+GUI(main.py)와 헤드리스 러너(runner.py)가 공유한다. (tkinter 미사용)
+"""
+import json
+import logging
+import random
+import time
+from dataclasses import asdict
+from typing import Optional
+
+from bot import NaverCafeBot
+from config import Config, communities_dict, review_dict
+from frontier import FrontierStore
+from governor import ResourceGovernor
+from helpers import article_id
+from journal import ResumeState, RunJournal, load_journal, run_dirs
+from profiling import RunProfiler
+
+
+def find_resume_state(logger: logging.Logger, *, dry_run: bool = False) -> Optional[ResumeState]:
+    """
+    dry-run이 아닌 마지막 실행 저널이 미완료면 재개 상태를, 아니면 None.
+    dry-run 실행 기록은 건너뛰고(벤치마크 뒤에도 중단된 실제 실행을 이어할 수 있게),
+    이번 실행이 dry-run이면 이어하지 않는다(실제 실행 저널에 게시하지 않은 액션이 성공으로 남지 않게).
+    """
+    if dry_run:
+        logger.info("dry-run은 지난 실행을 이어하지 않고 새 저널로 시작합니다."); return None
+    for run_dir in run_dirs():
+        try:
+            state = load_journal(run_dir)
+        except Exception as e:
+            logger.warning(f"실행 저널 로드 실패({run_dir.name}): {e}"); continue
+        if state.config.get("dry_run"):
+            logger.debug(f"dry-run 실행({run_dir.name})은 이어하기 대상이 아닙니다. 건너뜀."); continue
+        if state.finished:
+            logger.info(f"지난 실행({run_dir.name})은 이미 완료되었습니다. 새로 시작합니다."); return None
+        logger.info(f"지난 실행({run_dir.name})을 이어서 진행합니다.")
+        return state
+    logger.info("이어할 실행 기록이 없습니다. 새로 시작합니다."); return None
+
+
+def apply_resume(cfg: Config, resume: ResumeState):
+    """재개 시 카테고리 선택은 지난 실행의 것을 그대로 사용."""
+    cfg.communities = list(resume.config.get("communities", []))
+    cfg.reviews = list(resume.config.get("reviews", []))
+
+
+class RunEngine:
+    def __init__(self, cfg: Config, logger: logging.Logger, *, resume: Optional[ResumeState] = None,
+                 bot: Optional[NaverCafeBot] = None):
+        """bot: 웜업(warmup.SessionWarmer)으로 미리 실행/로그인해 둔 봇이 있으면 그대로 사용."""
+        if resume and cfg.dry_run:
+            logger.warning("dry-run은 지난 실행 저널을 이어쓰지 않습니다. 새 저널로 시작합니다."); resume = None
+        self.cfg = cfg; self.logger = logger; self.resume = resume
+        self.bot = bot or NaverCafeBot(cfg, logger)
+        self.journal: Optional[RunJournal] = None
+        self.governor: Optional[ResourceGovernor] = None
+        self.generations: list = []  # 글별 댓글 생성 모델/지연 (models.json)
+        self.shadow: list = []  # dry-run: 글별 제목/예정 댓글/단계별 시간 (dry_run_report.json)
+        self._started = 0.0
+        self.frontier = FrontierStore()
+
+    def run(self):
+        """
+        전체 실행. 예외는 로그 후 호출자에게 전달한다(GUI는 메시지박스, 러너는 종료코드).
+        브라우저는 닫지 않는다(호출자가 close_browser 결정).
+        """
+        cfg = self.cfg; resume = self.resume
+        journal = RunJournal(resume.run_dir) if resume else RunJournal.create(); self.journal = journal
+        if resume: journal.run_resume()
+        else: journal.run_start(asdict(cfg))
+        self.logger.info(f"Run journal: {journal.path}")
+        self.bot.debug_dir = str(journal.run_dir)
+        self._started = time.perf_counter()
+        if cfg.dry_run: self.logger.info("[DRY-RUN] 댓글 등록/좋아요 클릭 없이 수집·추출·생성만 실행합니다.")
+
+        profiler = None
+        if cfg.profile:
+            profiler = RunProfiler(journal.run_dir, sample_interval=cfg.profile_sample_interval,
+                                   top_n=cfg.profile_top_n)
+            profiler.start()
+
+        try:
+            bot = self.bot
+            if bot.driver is None: bot.open_browser()
+            else: self.logger.info("Reusing warmed-up Chrome session.")
+            if not bot.logged_in: bot.login()
+            self.governor = ResourceGovernor(bot, cfg, self.logger, on_event=journal.write)
+
+            for comm_name in cfg.communities:
+                menu_id = communities_dict.get(comm_name)
+                if not menu_id: self.logger.warning(f"Unknown community: {comm_name}"); continue
+                self._run_category("community", comm_name, menu_id, is_review=False)
+
+            for rev_name in cfg.reviews:
+                menu_id = review_dict.get(rev_name)
+                if not menu_id: self.logger.warning(f"Unknown review category: {rev_name}"); continue
+                self._run_category("review", rev_name, menu_id, is_review=True)
+
+            journal.run_done()
+            self.logger.info("All done.")
+        except Exception as e:
+            self.logger.error(f"Run failed: {e}", exc_info=True)
+            raise
+        finally:
+            if profiler: profiler.stop()
+            self._save_command_stats()
+            self._save_resource_stats()
+            self._save_model_stats()
+            if cfg.dry_run: self._save_dry_run_report()
+            journal.close()
+
+    def _save_command_stats(self):
+        stats = self.bot.counter.summary()
+        stats["article_load"] = dict(self.bot.load_stats)
+        self.logger.info(f"[Driver] WebDriver commands: total={stats['total']}, "
+                         f"articles={stats['articles']}, per_article_avg={stats['per_article_avg']}, "
+                         f"by_stage={stats['by_stage']}, article_load={stats['article_load']}")
+        try:
+            (self.journal.run_dir / "driver_commands.json").write_text(
+                json.dumps(stats, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as e:
+            self.logger.warning(f"커맨드 통계 저장 실패: {e}")
+
+    def _save_resource_stats(self):
+        if self.governor is None: return
+        stats = self.governor.summary()
+        self.logger.info(f"[Governor] peak RSS={stats['peak_rss_mb']}MB, tab recycles={stats['tab_recycles']}, "
+                         f"driver restarts={stats['driver_restarts']}")
+        try:
+            (self.journal.run_dir / "resources.json").write_text(
+                json.dumps(stats, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as e:
+            self.logger.warning(f"리소스 통계 저장 실패: {e}")
+
+    def _save_model_stats(self):
+        if self.bot.router is None: return
+        stats = {**self.bot.router.summary(), "articles": self.generations}
+        self.logger.info(f"[Router] by_model={stats['by_model']}, switches={len(stats['switches'])}")
+        try:
+            (self.journal.run_dir / "models.json").write_text(
+                json.dumps(stats, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as e:
+            self.logger.warning(f"모델 통계 저장 실패: {e}")
+
+    def _save_dry_run_report(self):
+        elapsed = time.perf_counter() - self._started
+        n = len(self.shadow)
+
+        def avg(key):
+            vals = [e[key] for e in self.shadow if e.get(key) is not None]
+            return round(sum(vals) / len(vals), 3) if vals else None
+
+        report = {
+            "articles": n, "elapsed_sec": round(elapsed, 1),
+            "articles_per_min": round(n / elapsed * 60, 2) if elapsed > 0 else None,
+            "avg_sec": {k: avg(f"{k}_sec") for k in ("open", "extract", "generate", "total")},
+            "entries": self.shadow,
+        }
+        self.logger.info(f"[DRY-RUN] {n} articles in {report['elapsed_sec']}s "
+                         f"({report['articles_per_min']}/min), avg_sec={report['avg_sec']}")
+        try:
+            (self.journal.run_dir / "dry_run_report.json").write_text(
+                json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        except Exception as e:
+            self.logger.warning(f"dry-run 리포트 저장 실패: {e}")
+
+    def _process_article(self, kind: str, name: str, link: str, *, is_review: bool,
+                         do_comment: bool, do_like: bool, results: dict):
+        """게시글 하나 열고 요청된 액션 수행. results[action]에 이번 결과(1/0)를 기록."""
+        bot = self.bot; journal = self.journal; cfg = self.cfg
+        t0 = time.perf_counter()
+        with bot.counter.article(link):
+            bot.open_article(link, need_comment=do_comment)
+            if do_comment:
+                results["comment"] = bot.write_comment(name, is_review=is_review)
+                journal.action(kind, name, link, "comment", results["comment"])
+                if bot.last_generation:
+                    self.generations.append({"kind": kind, "name": name, "link": link, **bot.last_generation})
+                    journal.write("generation", kind=kind, name=name, link=link, **bot.last_generation)
+            if do_like:
+                results["like"] = bot.press_like()
+                journal.action(kind, name, link, "like", results["like"])
+        if cfg.dry_run:
+            self.shadow.append({"kind": kind, "name": name, "link": link, "open_sec": bot.last_load_sec,
+                                **bot.last_article, "model": (bot.last_generation or {}).get("model"),
+                                "total_sec": round(time.perf_counter() - t0, 3)})
+        self.logger.debug(f"[Driver] {link} round trips: {bot.counter.article_total(link)}")
+        self.governor.observe(bot.last_load_sec)
+        if cfg.article_pause_max > 0: time.sleep(random.uniform(cfg.article_pause_min, cfg.article_pause_max))
+
+    def _run_category(self, kind: str, name: str, menu_id: str, *, is_review: bool):
+        bot = self.bot; journal = self.journal; cfg = self.cfg
+        label = "Review" if is_review else "Community"
+        st = self.resume.category(kind, name) if self.resume else None
+        if st and st.done:
+            self.logger.info(f"[{label}:{name}] 지난 실행에서 완료됨. 건너뜀."); return
+
+        bot.last_scan = []
+        if st and st.collected:
+            links = list(st.links)
+            self.logger.info(f"[{label}:{name}] 저널의 수집 링크 {len(links)}개 재사용.")
+        else:
+            start_page = st.last_page + 1 if st else 1
+            hl = self.frontier.high_low(menu_id)
+            if hl and cfg.pagination_mode != "off":
+                self.logger.info(f"[{label}:{name}] frontier high=#{hl[0]} low=#{hl[1]} ({cfg.pagination_mode})")
+            bot.go_to_menu(menu_id, page=start_page, reuse_within=cfg.warmup_menu_ttl)
+            links = bot.collect_post_links(
+                cfg.target_links, cfg.per_page_cap, cfg.max_pages,
+                start_page=start_page, initial=st.links if st else None,
+                on_page=lambda page, new: journal.page(kind, name, page, new),
+                frontier=self.frontier.blocks(menu_id) if cfg.pagination_mode != "off" else None,
+            )
+            journal.collected(kind, name, links)
+            journal.write("pagination", kind=kind, name=name, **bot.page_stats)
+            self.logger.info(f"[{label}:{name}] Collected {len(links)} links. "
+                             f"(pages scanned={bot.page_stats['scanned']}, skipped={bot.page_stats['skipped']}, "
+                             f"probes={bot.page_stats['probes']}, already processed={bot.page_stats['known']})")
+
+        processed = []
+        for link in links:
+            done = st.actions.get(link, {}) if st else {}
+            # 저널에 성공(1)으로 남은 액션만 건너뜀 (크래시로 0이 기록된 글은 재시도)
+            do_comment = cfg.do_comment and done.get("comment") != 1
+            do_like = cfg.do_like and done.get("like") != 1
+            results = dict(done)
+            if do_comment or do_like:
+                self._process_article(kind, name, link, is_review=is_review,
+                                      do_comment=do_comment, do_like=do_like, results=results)
+            # 프런티어에는 댓글과(요청된 경우) 좋아요까지 성공한 글만 → 실패 글/좋아요만 한 글은 다음 실행에서 다시 수집
+            aid = article_id(link)
+            if aid is not None and results.get("comment") == 1 and (not cfg.do_like or results.get("like") == 1):
+                processed.append(aid)
+        try:
+            if not cfg.dry_run: self.frontier.record_scan(menu_id, bot.last_scan, processed)  # dry-run은 처리로 치지 않음
+        except Exception as e:
+            self.logger.warning(f"프런티어 저장 실패: {e}")
+        journal.category_done(kind, name)
@@ -0,0 +1,81 @@
+"""
+메뉴별 처리 완료 게시글 프런티어 (지난 실행까지의 high-water / low-water 글번호)
+- 게시판 목록은 글번호 내림차순이므로, 목록상 연속으로 처리된 구간을 [low, high] 블록으로 저장
+- 블록에 포함된 글은 수집 단계에서 건너뛰고, 페이지 전체가 블록 안이면 페이지 탐색을 건너뛴다
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+FRONTIER_PATH = Path(os.getenv("DW_FRONTIER_PATH") or os.path.expanduser("~/.dw_automation_frontier.json"))
+MAX_BLOCKS = 50  # 메뉴별 보관 블록 수 (최신 순)
+
+Block = Tuple[int, int]
+
+
+def _merge(blocks: Iterable[Block]) -> List[Block]:
+    """겹치거나 맞닿은 [low, high] 구간 병합, high 내림차순."""
+    out: List[List[int]] = []
+    for lo, hi in sorted(blocks):
+        if out and lo <= out[-1][1] + 1:
+            out[-1][1] = max(out[-1][1], hi)
+        else:
+            out.append([lo, hi])
+    out.reverse()
+    return [(lo, hi) for lo, hi in out[:MAX_BLOCKS]]
+
+
+class FrontierStore:
+    def __init__(self, path: Path = FRONTIER_PATH):
+        self.path = Path(path)
+        self._data: Dict[str, List[Block]] = {}
+        if self.path.exists():
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+                self._data = {k: [(int(lo), int(hi)) for lo, hi in v] for k, v in raw.items()}
+            except Exception:
+                self._data = {}
+
+    def blocks(self, menu_id: str) -> List[Block]:
+        return list(self._data.get(str(menu_id), []))
+
+    def high_low(self, menu_id: str) -> Optional[Block]:
+        b = self._data.get(str(menu_id))
+        return (b[0][1], b[-1][0]) if b else None
+
+    def record_scan(self, menu_id: str, scan: List[Optional[int]], processed: Iterable[int]):
+        """
+        scan: 목록에서 본 글번호(목록 순서). None은 연속성이 끊긴 지점(페이지 상한 잘림 등).
+        processed: 이번 실행에서 처리한 글번호.
+        기존 블록에 속하거나 이번에 처리된 글이 목록상 연속된 구간을 새 블록으로 추가.
+        """
+        done = set(processed)
+        old = self.blocks(menu_id)
+        covered = lambda aid: aid in done or any(lo <= aid <= hi for lo, hi in old)
+        runs: List[Block] = []
+        cur: List[int] = []
+        for aid in scan + [None]:
+            if aid is not None and covered(aid):
+                cur.append(aid); continue
+            if cur: runs.append((min(cur), max(cur)))
+            cur = []
+        # 목록 순서 정보가 없는 처리분(재개 등)은 단일 글 블록으로 보존
+        scanned = {a for a in scan if a is not None}
+        runs.extend((a, a) for a in done - scanned)
+        self._data[str(menu_id)] = _merge(old + runs)
+        self.save()
+
+    def save(self):
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self._data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def find_block(blocks: List[Block], aid: Optional[int]) -> Optional[Block]:
+    if aid is None:
+        return None
+    for lo, hi in blocks:
+        if lo <= aid <= hi:
+            return (lo, hi)
+    return None
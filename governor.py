@@ -0,0 +1,114 @@
+"""
+크롬 리소스 거버너 (긴 실행에서 렌더러 메모리 증가 대응)
+- 게시글마다 페이지 로드 시간을, N개마다 크롬 프로세스 트리 RSS를 샘플링
+- 임계값(RSS / 최근 로드 시간 평균)을 넘으면 탭 재생성, 재생성 직후에도 넘으면 드라이버 재시작(쿠키 유지)
+- 샘플/재생성 이벤트는 summary()로 실행 통계에 남긴다
+psutil이 없으면 RSS 샘플링 없이 로드 시간만 본다.
+"""
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from config import Config
+
+if TYPE_CHECKING:
+    from bot import NaverCafeBot
+
+
+def chrome_tree_rss_mb(driver) -> Optional[float]:
+    """chromedriver 아래 크롬 프로세스 트리(브라우저 + 렌더러 + GPU 등) RSS 합계(MB). 측정 불가면 None."""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        total = 0
+        for p in root.children(recursive=True):
+            try: total += p.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied): pass
+        return round(total / (1024 * 1024), 1)
+    except Exception:
+        return None
+
+
+class ResourceGovernor:
+    def __init__(self, bot: "NaverCafeBot", cfg: Config, logger: logging.Logger, *,
+                 on_event: Optional[Callable[..., None]] = None):
+        """on_event(event, **data): 재생성/재시작 이벤트 콜백 (엔진이 실행 저널에 기록)."""
+        self.bot = bot; self.cfg = cfg; self.logger = logger; self.on_event = on_event
+        self.loads: deque = deque(maxlen=max(1, cfg.governor_window))
+        self.samples: List[dict] = []
+        self.events: List[dict] = []
+        self.articles = 0
+        self._since_recycle = 0
+        self._escalate = False  # 탭 재생성 직후 한 창(window) 안에서 또 넘으면 드라이버 재시작
+        self._warned_rss = False
+
+    def observe(self, load_sec: Optional[float]):
+        """게시글 하나 처리 후 호출. load_sec: 해당 게시글 페이지 로드 시간(초)."""
+        cfg = self.cfg
+        self.articles += 1; self._since_recycle += 1
+        if load_sec is not None: self.loads.append(load_sec)
+        avg_load = round(sum(self.loads) / len(self.loads), 2) if self.loads else None
+
+        rss = None
+        if cfg.governor_sample_every > 0 and self.articles % cfg.governor_sample_every == 0:
+            rss = chrome_tree_rss_mb(self.bot.driver)
+            if rss is None and not self._warned_rss:
+                self._warned_rss = True
+                self.logger.info("[Governor] 크롬 RSS 측정 불가(psutil 없음 등). 로드 시간만 감시합니다.")
+            self.samples.append({"article": self.articles, "rss_mb": rss, "avg_load_sec": avg_load,
+                                 "ts": round(time.time(), 3)})
+            self.logger.debug(f"[Governor] article={self.articles} rss={rss}MB avg_load={avg_load}s")
+
+        reason = None
+        if cfg.governor_max_rss_mb > 0 and rss is not None and rss > cfg.governor_max_rss_mb:
+            reason = f"rss {rss}MB > {cfg.governor_max_rss_mb}MB"
+        elif (cfg.governor_max_load_sec > 0 and avg_load is not None and len(self.loads) == self.loads.maxlen
+              and avg_load > cfg.governor_max_load_sec):
+            reason = f"avg load {avg_load}s > {cfg.governor_max_load_sec}s"
+        elif cfg.governor_recycle_every > 0 and self._since_recycle >= cfg.governor_recycle_every:
+            reason = f"periodic ({cfg.governor_recycle_every} articles)"
+
+        if reason is None:
+            if self._since_recycle > max(self.loads.maxlen, cfg.governor_sample_every): self._escalate = False
+            return
+        periodic = reason.startswith("periodic")
+        if self._escalate and not periodic:
+            self._recycle("restart", reason, rss, periodic=False)
+        else:
+            self._recycle("tab", reason, rss, periodic=periodic)
+
+    def _recycle(self, action: str, reason: str, rss: Optional[float], *, periodic: bool):
+        self.logger.info(f"[Governor] {action} recycle: {reason}")
+        t0 = time.perf_counter()
+        try:
+            if action == "restart": self.bot.restart_browser()
+            else: self.bot.recycle_tab()
+            ok = True
+        except Exception as e:
+            ok = False; self.logger.warning(f"[Governor] {action} recycle 실패: {e}")
+            if self.bot.driver is None: raise  # 재시작 중 브라우저를 잃으면 실행 계속 불가
+        after = chrome_tree_rss_mb(self.bot.driver) if self.bot.driver else None
+        ev = {"article": self.articles, "action": action, "reason": reason, "ok": ok,
+              "rss_before_mb": rss, "rss_after_mb": after, "sec": round(time.perf_counter() - t0, 2)}
+        self.events.append(ev)
+        if self.on_event:
+            try: self.on_event("recycle", **ev)
+            except Exception: pass
+        self.loads.clear(); self._since_recycle = 0
+        # 임계값 때문에 탭을 교체한 경우에만 다음 초과 시 재시작 (주기적 교체 뒤 첫 초과는 다시 탭 교체부터)
+        self._escalate = action == "tab" and not periodic
+
+    def summary(self) -> dict:
+        rss = [s["rss_mb"] for s in self.samples if s["rss_mb"] is not None]
+        return {
+            "articles": self.articles,
+            "peak_rss_mb": max(rss) if rss else None,
+            "tab_recycles": sum(1 for e in self.events if e["action"] == "tab"),
+            "driver_restarts": sum(1 for e in self.events if e["action"] == "restart"),
+            "events": self.events,
+            "samples": self.samples,
+        }
@@ -1,8 +1,16 @@
 import json
 import logging
 import re
+from typing import Optional
 
 logger = logging.getLogger("CafeBot.Helper")
+_HANGUL_RE = re.compile(r"[가-힣]")
+_COMMENT_RE = re.compile(r'{"comment"\s*:\s*"([^"]+)"}')
+_JSON_RESIDUE_RE = re.compile(r'[{}\[\]]|"comment"')  # 잘린 JSON 등 원문 폴백 흔적
+
+def _debug_on() -> bool:
+    # _preview() 등 인자 계산 자체를 건너뛰기 위한 가드 (DEBUG 비활성 시 비용 ~0)
+    return logger.isEnabledFor(logging.DEBUG)
 
 def _preview(text: str, limit: int = 120) -> str:
     if text is None:
@@ -10,12 +18,33 @@ def _preview(text: str, limit: int = 120) -> str:
     s = text.replace("\n", " ").replace("\r", " ")
     return s[:limit] + ("..." if len(s) > limit else "")
 
+_ARTICLE_ID_RE = re.compile(r"(?:/articles/|[?&]articleid=)(\d+)", re.IGNORECASE)
+
+def article_id(url: str) -> Optional[int]:
+    """게시글 URL에서 글번호 추출 (f-e/.../articles/123, ArticleRead?articleid=123). 없으면 None."""
+    m = _ARTICLE_ID_RE.search(url or "")
+    return int(m.group(1)) if m else None
+
+_CAFE_ID_RE = re.compile(r"(?:/cafes/|[?&]clubid=)(\d+)", re.IGNORECASE)
+
+def inner_article_url(link: str, template: str, fallback: str = "") -> Optional[str]:
+    """
+    게시글 링크 → cafe_main 프레임에 들어가는 게시글 문서 URL.
+    카페 ID는 링크에서, 없으면 fallback(예: cfg.cafe_base)에서 찾는다. 못 찾으면 None.
+    """
+    aid = article_id(link)
+    m = _CAFE_ID_RE.search(link or "") or _CAFE_ID_RE.search(fallback or "")
+    if aid is None or not m: return None
+    return template.format(cafe_id=m.group(1), article_id=aid)
+
 def count_hangul_letters(text: str) -> int:
     try:
-        logger.debug("count_hangul_letters() | len=%s | prev='%s'",
-                     0 if text is None else len(text), _preview(text))
-        cnt = len(re.findall(r"[가-힣]", text or ""))
-        logger.debug("count_hangul_letters() -> %d", cnt)
+        dbg = _debug_on()
+        if dbg:
+            logger.debug("count_hangul_letters() | len=%s | prev='%s'",
+                         0 if text is None else len(text), _preview(text))
+        cnt = len(_HANGUL_RE.findall(text or ""))
+        if dbg: logger.debug("count_hangul_letters() -> %d", cnt)
         return cnt
     except Exception as e:
         logger.debug("count_hangul_letters() error: %s", e, exc_info=True)
@@ -25,41 +54,67 @@ def clip_to_kchars(text: str, k: int) -> str:
     text = (text or "").strip()
     return text if len(text) <= k else text[:k].rstrip()
 
+def smart_clip_korean(text: str, k: int) -> str:
+    """k자 초과 시 문장 중간이 아닌 자연스러운 끝맺음(요/다/!/? 등)에서 자름."""
+    text = (text or "").strip()
+    if len(text) <= k:
+        return text
+    boundary = ["요!", "어요", "아요", "합니다.", "해요.", "다.", "요.", "!", "?", "…", "~"]
+    window = text[:k]
+    best = None
+    for b in boundary:
+        idx = window.rfind(b)
+        if idx != -1:
+            end = idx + len(b)
+            if best is None or end > best:
+                best = end
+    if best:
+        return window[:best].rstrip()
+    sp = window.rfind(" ")
+    if sp != -1 and sp >= int(k * 0.6):
+        return window[:sp].rstrip()
+    return window.rstrip()
+
 def extract_comment(response_text: str) -> str:
     """
     모델 출력에서 {"comment":"..."}만 안전 추출.
     JSON 실패 시 정규식 → 실패 시 원문 폴백.
     """
     try:
-        logger.debug("extract_comment() | len=%s | prev='%s'",
-                     0 if response_text is None else len(response_text), _preview(response_text))
+        dbg = _debug_on()
+        if dbg:
+            logger.debug("extract_comment() | len=%s | prev='%s'",
+                         0 if response_text is None else len(response_text), _preview(response_text))
         response_text = (response_text or "").strip()
         try:
             obj = json.loads(response_text)
             val = (obj.get("comment", "") if isinstance(obj, dict) else "")
             val = (val or "").strip()
-            logger.debug("extract_comment() JSON ok | len=%d | prev='%s'", len(val), _preview(val))
+            if dbg: logger.debug("extract_comment() JSON ok | len=%d | prev='%s'", len(val), _preview(val))
             return val
         except Exception:
-            m = re.search(r'{"comment"\s*:\s*"([^"]+)"}', response_text)
+            m = _COMMENT_RE.search(response_text)
             if m:
                 val = m.group(1).strip()
-                logger.debug("extract_comment() regex ok | len=%d | prev='%s'", len(val), _preview(val))
+                if dbg: logger.debug("extract_comment() regex ok | len=%d | prev='%s'", len(val), _preview(val))
                 return val
-            logger.debug("extract_comment() fallback original")
+            if dbg: logger.debug("extract_comment() fallback original")
             return response_text
     except Exception as e:
         logger.debug("extract_comment() error: %s", e, exc_info=True)
         raise
 
 def validate_comment(comment: str, min_len: int = 6, max_len: int = 40) -> bool:
-    """한글 글자수 하한 + 전체 길이 상한(40)"""
+    """한글 글자수 하한 + 전체 길이 상한(40) + JSON 잔여물/줄바꿈 없음"""
     try:
-        logger.debug("validate_comment() | min=%d | max=%d | len=%s | prev='%s'",
-                     min_len, max_len, 0 if comment is None else len(comment), _preview(comment))
+        dbg = _debug_on()
+        if dbg:
+            logger.debug("validate_comment() | min=%d | max=%d | len=%s | prev='%s'",
+                         min_len, max_len, 0 if comment is None else len(comment), _preview(comment))
         cnt = count_hangul_letters(comment or "")
-        ok = (cnt >= min_len) and (len(comment or "") <= max_len)
-        logger.debug("validate_comment() -> hangul=%d | valid=%s", cnt, ok)
+        ok = ((cnt >= min_len) and (len(comment or "") <= max_len)
+              and "\n" not in (comment or "") and not _JSON_RESIDUE_RE.search(comment or ""))
+        if dbg: logger.debug("validate_comment() -> hangul=%d | valid=%s", cnt, ok)
         return ok
     except Exception as e:
         logger.debug("validate_comment() error: %s", e, exc_info=True)
@@ -0,0 +1,149 @@
+"""
+실행 저널 (append-only JSONL)
+- 카테고리별 스캔한 페이지 / 수집 링크 / 링크별 액션 결과를 발생 즉시 기록(flush+fsync)
+- 크래시/중단 후 '지난 실행 이어하기'로 남은 지점부터 재개
+"""
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+RUNS_DIR = Path(os.getenv("DW_RUNS_DIR") or os.path.expanduser("~/.dw_automation_runs"))
+JOURNAL_NAME = "journal.jsonl"
+
+# 저널에 남기지 않을 설정 키 (평문 자격증명)
+_SECRET_KEYS = ("naver_pw", "openai_api_key")
+
+
+def new_run_dir() -> Path:
+    return RUNS_DIR / time.strftime("%Y%m%d_%H%M%S")
+
+
+def _cat_key(kind: str, name: str) -> str:
+    return f"{kind}:{name}"
+
+
+@dataclass
+class CategoryState:
+    kind: str
+    name: str
+    pages: List[int] = field(default_factory=list)
+    links: List[str] = field(default_factory=list)
+    collected: bool = False                      # 링크 목록 확정 여부
+    actions: Dict[str, Dict[str, int]] = field(default_factory=dict)  # link -> {action: result}
+    done: bool = False
+
+    @property
+    def last_page(self) -> int:
+        return max(self.pages) if self.pages else 0
+
+
+@dataclass
+class ResumeState:
+    run_dir: Path
+    config: dict = field(default_factory=dict)
+    categories: Dict[str, CategoryState] = field(default_factory=dict)
+    finished: bool = False
+
+    def category(self, kind: str, name: str) -> Optional[CategoryState]:
+        return self.categories.get(_cat_key(kind, name))
+
+
+class RunJournal:
+    def __init__(self, run_dir: Path):
+        self.run_dir = Path(run_dir)
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.run_dir / JOURNAL_NAME
+        self._fp = open(self.path, "a", encoding="utf-8")
+        # 크래시로 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 보정
+        if self.path.stat().st_size and not self.path.read_bytes().endswith(b"\n"):
+            self._fp.write("\n")
+
+    @classmethod
+    def create(cls) -> "RunJournal":
+        return cls(new_run_dir())
+
+    def write(self, event: str, **data) -> None:
+        if self._fp is None:
+            return
+        rec = {"ts": round(time.time(), 3), "event": event, **data}
+        self._fp.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+    # ----- 이벤트 -----
+    def run_start(self, config: dict) -> None:
+        self.write("run_start", config={k: v for k, v in config.items() if k not in _SECRET_KEYS})
+
+    def run_resume(self) -> None:
+        self.write("run_resume")
+
+    def page(self, kind: str, name: str, page: int, links: List[str]) -> None:
+        self.write("page", kind=kind, name=name, page=page, links=links)
+
+    def collected(self, kind: str, name: str, links: List[str]) -> None:
+        self.write("collected", kind=kind, name=name, links=links)
+
+    def action(self, kind: str, name: str, link: str, action: str, result: int) -> None:
+        self.write("action", kind=kind, name=name, link=link, action=action, result=result)
+
+    def category_done(self, kind: str, name: str) -> None:
+        self.write("category_done", kind=kind, name=name)
+
+    def run_done(self) -> None:
+        self.write("run_done")
+
+    def close(self) -> None:
+        if self._fp is not None:
+            try:
+                self._fp.close()
+            finally:
+                self._fp = None
+
+
+def run_dirs() -> List[Path]:
+    """저널이 있는 실행 디렉터리, 최신순."""
+    if not RUNS_DIR.exists():
+        return []
+    return sorted((p for p in RUNS_DIR.iterdir() if (p / JOURNAL_NAME).exists()), reverse=True)
+
+
+def latest_run_dir() -> Optional[Path]:
+    dirs = run_dirs()
+    return dirs[0] if dirs else None
+
+
+def load_journal(run_dir: Path) -> ResumeState:
+    """저널을 재생해 재개 상태를 만든다. 크래시로 잘린 마지막 줄은 무시."""
+    state = ResumeState(run_dir=Path(run_dir))
+    path = state.run_dir / JOURNAL_NAME
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            ev = rec.get("event")
+            if ev == "run_start":
+                state.config = rec.get("config", {})
+                continue
+            if ev == "run_done":
+                state.finished = True
+                continue
+            if "kind" not in rec:
+                continue
+            key = _cat_key(rec["kind"], rec["name"])
+            cat = state.categories.setdefault(key, CategoryState(rec["kind"], rec["name"]))
+            if ev == "page":
+                cat.pages.append(int(rec["page"]))
+                cat.links.extend(u for u in rec.get("links", []) if u not in cat.links)
+            elif ev == "collected":
+                cat.links = list(rec.get("links", []))
+                cat.collected = True
+            elif ev == "action":
+                cat.actions.setdefault(rec["link"], {})[rec["action"]] = int(rec.get("result", 0))
+            elif ev == "category_done":
+                cat.done = True
+    return state
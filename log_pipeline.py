@@ -0,0 +1,124 @@
+"""
+비동기 로깅 파이프라인 (QueueHandler → QueueListener)
+- 핫패스에서는 LogRecord를 큐에 넣기만 하고, 포맷/출력은 리스너 스레드에서 수행
+- 포맷 결과를 레코드에 캐시해 싱크가 여러 개여도 레코드당 한 번만 포맷
+- 싱크별 레벨 지정, 콘솔 출력은 초당 개수 제한(WARNING 이상은 제한 없음)
+"""
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+DEFAULT_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
+DEFAULT_DATEFMT = "%H:%M:%S"
+
+
+class CachingFormatter(logging.Formatter):
+    """레코드당 한 번만 포맷하고 결과를 record에 저장."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        cached = getattr(record, "_formatted", None)
+        if cached is None:
+            cached = super().format(record)
+            record._formatted = cached
+        return cached
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    같은 프로세스 안의 큐이므로 pickling 대비 선포맷(prepare)을 생략.
+    메시지 합성/예외 포맷은 리스너 쪽 싱크가 실제로 출력할 때 일어난다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class ThrottledStreamHandler(logging.StreamHandler):
+    """초당 max_per_sec개까지만 출력, 초과분은 버리고 다음 구간에 억제 개수를 알림."""
+
+    def __init__(self, stream=None, max_per_sec: int = 20):
+        super().__init__(stream or sys.stderr)
+        self.max_per_sec = max_per_sec
+        self._window = 0
+        self._count = 0
+        self._suppressed = 0
+
+    def emit(self, record: logging.LogRecord):
+        if record.levelno < logging.WARNING and self.max_per_sec > 0:
+            now = int(time.monotonic())
+            if now != self._window:
+                self._report_suppressed()
+                self._window, self._count = now, 0
+            self._count += 1
+            if self._count > self.max_per_sec:
+                self._suppressed += 1
+                return
+        super().emit(record)
+
+    def _report_suppressed(self):
+        if self._suppressed:
+            self.stream.write(f"... {self._suppressed} log records suppressed{self.terminator}")
+            self._suppressed = 0
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._report_suppressed()
+        finally:
+            self.release()
+        super().flush()
+
+
+class LogPipeline:
+    """
+    pipeline = LogPipeline(logging.getLogger("CafeBot"))
+    pipeline.add_sink(ThrottledStreamHandler(), logging.INFO)
+    pipeline.start()
+    ...
+    pipeline.stop()
+    """
+
+    def __init__(self, logger: logging.Logger, *, fmt: str = DEFAULT_FORMAT, datefmt: str = DEFAULT_DATEFMT):
+        self.logger = logger
+        self.formatter = CachingFormatter(fmt, datefmt)
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        self.sinks: List[logging.Handler] = []
+        self._listener: Optional[QueueListener] = None
+
+    def add_sink(self, handler: logging.Handler, level: int) -> logging.Handler:
+        handler.setLevel(level)
+        handler.setFormatter(self.formatter)
+        self.sinks.append(handler)
+        return handler
+
+    def start(self):
+        self.logger.handlers.clear()
+        self.logger.addHandler(LazyQueueHandler(self.queue))
+        self.logger.propagate = False
+        self._listener = QueueListener(self.queue, *self.sinks, respect_handler_level=True)
+        self._listener.start()
+        self.sync_level()
+
+    def sync_level(self):
+        """로거 레벨을 싱크가 필요로 하는 최저 레벨로 맞춤 → 아무도 안 받는 레코드는 생성조차 안 됨."""
+        levels = [h.level for h in self.sinks] or [logging.WARNING]
+        self.logger.setLevel(min(levels))
+
+    def set_sink_level(self, handler: logging.Handler, level: int):
+        handler.setLevel(level)
+        self.sync_level()
+
+    def flush(self):
+        """큐에 쌓인 레코드가 모두 싱크로 전달될 때까지 대기."""
+        if self._listener is not None:
+            self.queue.join()
+
+    def stop(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            for h in self.sinks:
+                h.flush()
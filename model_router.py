@@ -0,0 +1,110 @@
+"""
+지연 시간 기반 모델 라우팅 (기본 모델 ↔ 대체 모델)
+- 모델별 최근 호출 지연/오류를 롤링 창으로 추적
+- 기본 모델의 평균 지연이 SLO를 넘거나 오류율이 높으면 대체 모델로 전환
+- 대체 모델 사용 중에는 N건마다 기본 모델을 한 번 시험 호출해, SLO 안에 성공하면 복귀
+- 호출 실패(429/5xx/타임아웃)는 같은 글에서 바로 다른 모델로 재시도
+"""
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from config import Config
+
+T = TypeVar("T")
+
+
+class ModelStats:
+    def __init__(self, window: int):
+        self.recent: Deque[Tuple[float, bool]] = deque(maxlen=max(1, window))
+        self.calls = 0; self.errors = 0; self.total_sec = 0.0
+
+    def add(self, sec: float, ok: bool):
+        self.recent.append((sec, ok))
+        self.calls += 1; self.total_sec += sec
+        if not ok: self.errors += 1
+
+    @property
+    def avg_sec(self) -> Optional[float]:
+        return sum(s for s, _ in self.recent) / len(self.recent) if self.recent else None
+
+    @property
+    def error_rate(self) -> float:
+        return sum(1 for _, ok in self.recent if not ok) / len(self.recent) if self.recent else 0.0
+
+    def summary(self) -> dict:
+        return {"calls": self.calls, "errors": self.errors,
+                "avg_sec": round(self.total_sec / self.calls, 3) if self.calls else None}
+
+
+class ModelRouter:
+    def __init__(self, cfg: Config, logger: logging.Logger):
+        self.cfg = cfg; self.logger = logger
+        self.primary = cfg.openai_model
+        self.fallback = cfg.openai_fallback_model if cfg.openai_fallback_model != cfg.openai_model else ""
+        self.active = self.primary
+        self.stats: Dict[str, ModelStats] = {}
+        self.switches: List[dict] = []
+        self._since_switch = 0
+
+    def _stats(self, model: str) -> ModelStats:
+        return self.stats.setdefault(model, ModelStats(self.cfg.router_window))
+
+    def _unhealthy(self, model: str) -> Optional[str]:
+        st = self._stats(model); cfg = self.cfg
+        if len(st.recent) < cfg.router_min_samples: return None
+        if st.error_rate > cfg.router_max_error_rate: return f"error rate {st.error_rate:.0%}"
+        if st.avg_sec > cfg.router_latency_slo_sec: return f"avg {st.avg_sec:.2f}s > SLO {cfg.router_latency_slo_sec}s"
+        return None
+
+    def _switch(self, to: str, reason: str):
+        self.logger.info(f"[Router] {self.active} -> {to}: {reason}")
+        self.switches.append({"ts": round(time.time(), 3), "from": self.active, "to": to, "reason": reason})
+        self.active = to; self._since_switch = 0
+        self._stats(to).recent.clear()  # 전환 후 창은 새로 채운다
+
+    def _candidates(self) -> List[str]:
+        """이번 호출에서 시도할 모델 순서."""
+        if not self.fallback: return [self.primary]
+        if self.active == self.fallback:
+            self._since_switch += 1
+            if self._since_switch % max(1, self.cfg.router_probe_every) == 0:
+                return [self.primary, self.fallback]  # 복귀 시험 (실패해도 같은 글은 대체 모델로)
+            return [self.fallback]
+        return [self.primary, self.fallback]
+
+    def call(self, fn: Callable[[str], T]) -> Tuple[str, T, float]:
+        """fn(model)을 라우팅해서 호출 → (응답한 모델, 결과, 지연초). 모든 후보가 실패하면 마지막 예외."""
+        last_err: Optional[Exception] = None
+        for model in self._candidates():
+            t0 = time.perf_counter()
+            try:
+                result = fn(model)
+            except Exception as e:
+                sec = time.perf_counter() - t0
+                self._stats(model).add(sec, False); last_err = e
+                self.logger.warning(f"[Router] {model} 호출 실패({sec:.2f}s): {e}")
+                self._after(model, sec, False)
+                continue
+            sec = time.perf_counter() - t0
+            self._stats(model).add(sec, True)
+            self._after(model, sec, True)
+            return model, result, round(sec, 3)
+        raise last_err
+
+    def _after(self, model: str, sec: float, ok: bool):
+        if not self.fallback: return
+        if self.active == self.primary and model == self.primary:
+            reason = self._unhealthy(self.primary) or (None if ok else "request failed")
+            if reason: self._switch(self.fallback, reason)
+        elif self.active == self.fallback and model == self.primary:
+            if ok and sec <= self.cfg.router_latency_slo_sec:
+                self._switch(self.primary, f"probe {sec:.2f}s within SLO")
+
+    def summary(self) -> dict:
+        return {
+            "primary": self.primary, "fallback": self.fallback or None, "active": self.active,
+            "by_model": {m: st.summary() for m, st in self.stats.items()},
+            "switches": self.switches,
+        }
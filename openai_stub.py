@@ -0,0 +1,264 @@
+"""
+로컬 OpenAI 호환 스텁 서버 (오프라인 생성 부하 테스트용)
+- POST /v1/responses : Responses API 형태로 {"comment": ...} 출력 반환
+                       ("stream": true면 SSE: response.created → output_text.delta 여러 개 → response.completed)
+- GET  /stats        : 누적 요청/오류 통계
+- 지연 분포, 오류율, 잘린/깨진 출력 비율을 옵션으로 조절 (--seed로 재현 가능)
+  스트리밍이면 지연의 STREAM_TTFT_RATIO만큼 첫 이벤트 전에, 나머지는 델타 사이에 나눠 쉰다
+
+사용:
+    python openai_stub.py --port 8765 --latency-ms 400 --latency-dist lognormal --error-rate 0.05
+    → Config.openai_base_url = "http://127.0.0.1:8765/v1" (runner는 OPENAI_BASE_URL)
+"""
+import argparse
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("OpenAIStub")
+
+COMMENT_TEMPLATES = [
+    "{topic} 이야기 잘 읽었어요, 응원할게요",
+    "{topic} 고민 충분히 공감돼요, 천천히 정해보세요",
+    "좋은 정보 감사해요, {topic} 참고할게요",
+    "{topic} 저도 비슷했어요, 잘 해결되길 바라요",
+    "마음이 느껴지는 글이네요, 힘내세요",
+    "정성스러운 후기 덕분에 많이 배워가요",
+]
+DEFAULT_TOPIC = "결혼 준비"
+STREAM_TTFT_RATIO = 0.3  # 스트리밍: 첫 토큰까지 걸리는 몫
+STREAM_CHUNK_CHARS = 4   # 델타 하나당 글자 수
+
+
+class StubSettings:
+    def __init__(self, *, latency_ms: float = 300.0, latency_dist: str = "fixed", jitter_ms: float = 100.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 partial_rate: float = 0.0, malformed_rate: float = 0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.partial_rate = partial_rate
+        self.malformed_rate = malformed_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0, "partial": 0, "malformed": 0}
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.rng.random()
+
+    def latency(self) -> float:
+        """초 단위 지연."""
+        with self.lock:
+            mu, sd = self.latency_ms, self.jitter_ms
+            if self.latency_dist == "uniform":
+                ms = self.rng.uniform(max(0.0, mu - sd), mu + sd)
+            elif self.latency_dist == "normal":
+                ms = self.rng.gauss(mu, sd)
+            elif self.latency_dist == "lognormal":
+                # 평균 mu, 표준편차 sd가 되도록 파라미터 변환 (긴 꼬리)
+                var = (sd / mu) ** 2 if mu > 0 else 0.0
+                sigma2 = math.log1p(var)
+                ms = self.rng.lognormvariate(math.log(max(mu, 1e-6)) - sigma2 / 2, sigma2 ** 0.5)
+            else:
+                ms = mu
+        return max(0.0, ms) / 1000.0
+
+    def pick_comment(self, prompt: str) -> str:
+        m = re.search(r"제목:\s*(.+)", prompt or "")
+        words = m.group(1).split() if m else []
+        topic = words[0][:8] if words else DEFAULT_TOPIC
+        with self.lock:
+            tpl = self.rng.choice(COMMENT_TEMPLATES)
+        return tpl.format(topic=topic)
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+
+def _message_item(msg_id: str, text: str, status: str = "completed") -> dict:
+    return {
+        "type": "message", "id": msg_id, "status": status, "role": "assistant",
+        "content": [{"type": "output_text", "text": text, "annotations": []}] if status == "completed" else [],
+    }
+
+
+def _response_body(model: str, text: str, *, resp_id: str = "", msg_id: str = "", status: str = "completed") -> dict:
+    now = int(time.time())
+    return {
+        "id": resp_id or f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": now,
+        "status": status,
+        "model": model,
+        "output": [_message_item(msg_id or f"msg_{uuid.uuid4().hex}", text)] if status == "completed" else [],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": 0, "output_tokens": len(text),
+            "total_tokens": len(text),
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens_details": {"reasoning_tokens": 0},
+        },
+    }
+
+
+def make_handler(settings: StubSettings):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):
+            logger.debug("%s - %s", self.address_string(), fmt % args)
+
+        def _send_json(self, status: int, body: dict, headers=None):
+            self._send_raw(status, json.dumps(body, ensure_ascii=False).encode("utf-8"), headers)
+
+        def _send_raw(self, status: int, data: bytes, headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/") == "/stats":
+                with settings.lock:
+                    body = dict(settings.stats)
+                self._send_json(200, body)
+            else:
+                self._send_json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            if self.path.rstrip("/") not in ("/v1/responses", "/responses"):
+                self._send_json(404, {"error": {"message": "not found", "type": "invalid_request_error"}})
+                return
+            try:
+                req = json.loads(raw or b"{}")
+            except ValueError:
+                self._send_json(400, {"error": {"message": "invalid json", "type": "invalid_request_error"}})
+                return
+
+            settings.count("requests")
+            stream = bool(req.get("stream"))
+            latency = settings.latency()
+            time.sleep(latency * STREAM_TTFT_RATIO if stream else latency)
+
+            r = settings.roll()
+            if r < settings.error_rate:
+                settings.count("errors")
+                self._send_json(500, {"error": {"message": "stub internal error", "type": "server_error"}})
+                return
+            r -= settings.error_rate
+            if r < settings.rate_limit_rate:
+                settings.count("rate_limited")
+                self._send_json(429, {"error": {"message": "stub rate limit", "type": "rate_limit_error"}},
+                                headers={"Retry-After": "1"})
+                return
+
+            prompt = req.get("input") if isinstance(req.get("input"), str) else json.dumps(req.get("input"), ensure_ascii=False)
+            comment = settings.pick_comment(prompt)
+            text = json.dumps({"comment": comment}, ensure_ascii=False)
+
+            r = settings.roll()
+            if r < settings.partial_rate:
+                settings.count("partial")
+                text = text[: max(1, len(text) // 2)]
+            elif r - settings.partial_rate < settings.malformed_rate:
+                settings.count("malformed")
+                text = f"댓글: {comment}\n(형식 없음)"
+            else:
+                settings.count("ok")
+            if stream:
+                self._send_stream(req.get("model", "stub"), text, latency * (1 - STREAM_TTFT_RATIO))
+            else:
+                self._send_json(200, _response_body(req.get("model", "stub"), text))
+
+        def _send_stream(self, model: str, text: str, remaining: float):
+            """Responses API 스트리밍 이벤트 순서를 흉내 낸 SSE. Content-Length 없이 보내고 연결을 닫는다."""
+            resp_id, msg_id = f"resp_{uuid.uuid4().hex}", f"msg_{uuid.uuid4().hex}"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            seq = 0
+
+            def event(kind: str, **data):
+                nonlocal seq
+                payload = json.dumps({"type": kind, "sequence_number": seq, **data}, ensure_ascii=False)
+                self.wfile.write(f"event: {kind}\ndata: {payload}\n\n".encode("utf-8")); self.wfile.flush()
+                seq += 1
+
+            part = {"type": "output_text", "text": "", "annotations": []}
+            loc = {"item_id": msg_id, "output_index": 0, "content_index": 0}
+            event("response.created", response=_response_body(model, "", resp_id=resp_id, status="in_progress"))
+            event("response.in_progress", response=_response_body(model, "", resp_id=resp_id, status="in_progress"))
+            event("response.output_item.added", output_index=0, item=_message_item(msg_id, "", "in_progress"))
+            event("response.content_part.added", part=part, **loc)
+            chunks = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)] or [""]
+            for chunk in chunks:
+                time.sleep(remaining / len(chunks))
+                event("response.output_text.delta", delta=chunk, logprobs=[], **loc)
+            event("response.output_text.done", text=text, logprobs=[], **loc)
+            event("response.content_part.done", part={**part, "text": text}, **loc)
+            event("response.output_item.done", output_index=0, item=_message_item(msg_id, text))
+            event("response.completed", response=_response_body(model, text, resp_id=resp_id, msg_id=msg_id))
+
+    return Handler
+
+
+def serve(host: str, port: int, settings: StubSettings) -> ThreadingHTTPServer:
+    """백그라운드 스레드로 서버를 띄우고 서버 객체를 반환(shutdown()으로 종료)."""
+    httpd = ThreadingHTTPServer((host, port), make_handler(settings))
+    threading.Thread(target=httpd.serve_forever, name="OpenAIStub", daemon=True).start()
+    return httpd
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Local OpenAI-compatible /v1/responses stub")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency-ms", type=float, default=300.0, help="평균 지연(ms)")
+    ap.add_argument("--latency-dist", choices=["fixed", "uniform", "normal", "lognormal"], default="fixed")
+    ap.add_argument("--jitter-ms", type=float, default=100.0, help="uniform 폭 / normal·lognormal 표준편차(ms)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 비율")
+    ap.add_argument("--rate-limit-rate", type=float, default=0.0, help="HTTP 429 비율")
+    ap.add_argument("--partial-rate", type=float, default=0.0, help="JSON이 중간에 잘린 출력 비율")
+    ap.add_argument("--malformed-rate", type=float, default=0.0, help="JSON 형식이 아닌 출력 비율")
+    ap.add_argument("--seed", type=int, default=None)
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s - %(message)s", datefmt="%H:%M:%S")
+    settings = StubSettings(
+        latency_ms=args.latency_ms, latency_dist=args.latency_dist, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+        partial_rate=args.partial_rate, malformed_rate=args.malformed_rate, seed=args.seed,
+    )
+    httpd = ThreadingHTTPServer((args.host, args.port), make_handler(settings))
+    logger.info(f"OpenAI stub listening on http://{args.host}:{args.port}/v1")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        logger.info(f"Stats: {settings.stats}")
+
+
+if __name__ == "__main__":
+    main()
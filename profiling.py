@@ -0,0 +1,139 @@
+"""
+프로파일링 모드
+- cProfile(CPU) + tracemalloc(메모리) + 선택적 주기 스택 샘플링
+- 실행 종료 시 실행 디렉터리에 profile.prof / profile_summary.txt / stacks.folded 저장
+"""
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("CafeBot.Profiler")
+
+
+class StackSampler(threading.Thread):
+    """대상 스레드의 콜스택을 주기적으로 떠서 folded 형식(a;b;c)으로 집계."""
+
+    def __init__(self, target_thread_id: int, interval: float):
+        super().__init__(name="StackSampler", daemon=True)
+        self.target_thread_id = target_thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_evt = threading.Event()
+
+    def run(self):
+        while not self._stop_evt.wait(self.interval):
+            frame = sys._current_frames().get(self.target_thread_id)
+            if frame is None:
+                continue
+            parts = []
+            while frame is not None:
+                code = frame.f_code
+                parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(parts))] += 1
+            self.samples += 1
+
+    def stop(self):
+        self._stop_evt.set()
+        self.join(timeout=max(1.0, self.interval * 2))
+
+
+class RunProfiler:
+    """
+    with RunProfiler(run_dir, sample_interval=0.05):
+        ... 실행 ...
+    sample_interval <= 0 이면 스택 샘플링 생략.
+    """
+
+    def __init__(self, run_dir: Path, *, sample_interval: float = 0.0, top_n: int = 30):
+        self.run_dir = Path(run_dir)
+        self.sample_interval = sample_interval
+        self.top_n = top_n
+        self._profile: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._started_tracemalloc = False
+        self._t0 = 0.0
+
+    def __enter__(self) -> "RunProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def start(self):
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            self._started_tracemalloc = True
+        if self.sample_interval > 0:
+            self._sampler = StackSampler(threading.get_ident(), self.sample_interval)
+            self._sampler.start()
+        self._t0 = time.perf_counter()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        logger.info(f"Profiling started (sample_interval={self.sample_interval}s)")
+
+    def stop(self):
+        if self._profile is None:
+            return
+        self._profile.disable()
+        elapsed = time.perf_counter() - self._t0
+        if self._sampler:
+            self._sampler.stop()
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+        try:
+            self._write_outputs(elapsed, snapshot, current, peak)
+        except Exception as e:
+            logger.warning(f"프로파일 저장 실패: {e}", exc_info=True)
+        finally:
+            self._profile = None
+            self._sampler = None
+
+    def _write_outputs(self, elapsed: float, snapshot, current: int, peak: int):
+        prof_path = self.run_dir / "profile.prof"
+        self._profile.dump_stats(str(prof_path))
+
+        buf = io.StringIO()
+        buf.write(f"wall time: {elapsed:.2f}s\n")
+        buf.write(f"traced memory: current={current / 1024:.1f} KiB, peak={peak / 1024:.1f} KiB\n\n")
+
+        for sort_key in ("cumulative", "tottime"):
+            buf.write(f"===== cProfile top {self.top_n} by {sort_key} =====\n")
+            pstats.Stats(self._profile, stream=buf).strip_dirs().sort_stats(sort_key).print_stats(self.top_n)
+
+        if snapshot is not None:
+            buf.write(f"===== tracemalloc top {self.top_n} by line =====\n")
+            for stat in snapshot.statistics("lineno")[:self.top_n]:
+                buf.write(f"{stat}\n")
+            buf.write("\n")
+
+        if self._sampler and self._sampler.samples:
+            folded = self.run_dir / "stacks.folded"
+            with open(folded, "w", encoding="utf-8") as f:
+                for stack, cnt in self._sampler.stacks.most_common():
+                    f.write(f"{stack} {cnt}\n")
+            buf.write(f"===== sampled stacks (interval={self.sample_interval}s, samples={self._sampler.samples}) =====\n")
+            leaf = Counter()
+            for stack, cnt in self._sampler.stacks.items():
+                leaf[stack.rsplit(";", 1)[-1]] += cnt
+            for frame, cnt in leaf.most_common(self.top_n):
+                buf.write(f"{cnt / self._sampler.samples:6.1%}  {frame}\n")
+
+        (self.run_dir / "profile_summary.txt").write_text(buf.getvalue(), encoding="utf-8")
+        logger.info(f"Profile saved: {prof_path}")
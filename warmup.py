@@ -0,0 +1,86 @@
+"""
+세션 웜업: 사용자가 설정을 만지는 동안 백그라운드에서
+브라우저 실행 → 드라이버 준비 → 로그인 → 첫 선택 메뉴 미리 열기.
+Start 시 take()로 준비된 봇을 그대로 넘겨받는다. (tkinter 미사용)
+"""
+import copy
+import logging
+import threading
+from typing import Optional
+
+from bot import NaverCafeBot
+from config import Config
+
+
+class SessionWarmer:
+    def __init__(self, cfg: Config, logger: logging.Logger):
+        self.cfg = copy.deepcopy(cfg)  # 웜업 시점 스냅샷 (자격증명 비교용)
+        self.logger = logger
+        self.bot: Optional[NaverCafeBot] = None
+        self.error: Optional[BaseException] = None
+        self._menu_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="SessionWarmer", daemon=True)
+
+    def start(self) -> "SessionWarmer":
+        self._thread.start()
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def set_menu(self, menu_id: Optional[str]):
+        """미리 열 메뉴(메인 스레드에서 선택이 바뀔 때 갱신)."""
+        with self._lock:
+            self._menu_id = menu_id
+
+    def _run(self):
+        bot = NaverCafeBot(self.cfg, self.logger)
+        try:
+            self.logger.info("[Warmup] Chrome 실행/드라이버 준비 중...")
+            bot.open_browser()
+            if self._cancelled.is_set(): raise RuntimeError("cancelled")
+            bot.login()
+            if self._cancelled.is_set(): raise RuntimeError("cancelled")
+            with self._lock:
+                menu_id = self._menu_id
+            if menu_id:
+                bot.go_to_menu(menu_id)
+            with self._lock:
+                if self._cancelled.is_set(): raise RuntimeError("cancelled")
+                self.bot = bot
+            self.logger.info("[Warmup] 세션 준비 완료. Start 시 바로 사용합니다.")
+        except Exception as e:
+            self.error = e
+            if not self._cancelled.is_set():
+                self.logger.warning(f"[Warmup] 실패, Start 시 새로 시작합니다: {e}")
+            try: bot.close_browser()
+            except Exception: pass
+
+    def take(self, cfg: Config) -> Optional[NaverCafeBot]:
+        """
+        웜업이 끝날 때까지 기다린 뒤 준비된 봇을 넘긴다.
+        자격증명/headless가 바뀌었으면 폐기하고 None (엔진이 새로 시작).
+        """
+        self._thread.join()
+        bot, self.bot = self.bot, None
+        if bot is None:
+            return None
+        if (cfg.naver_id, cfg.naver_pw, cfg.headless) != (self.cfg.naver_id, self.cfg.naver_pw, self.cfg.headless):
+            self.logger.info("[Warmup] 설정이 바뀌어 준비된 세션을 폐기합니다.")
+            try: bot.close_browser()
+            except Exception: pass
+            return None
+        bot.cfg = cfg
+        return bot
+
+    def cancel(self):
+        """진행 중이면 현재 단계가 끝난 뒤 _run이 스스로 정리, 준비 완료 상태면 즉시 종료."""
+        self._cancelled.set()
+        with self._lock:
+            bot, self.bot = self.bot, None
+        if bot:
+            try: bot.close_browser()
+            except Exception: pass